@@ -4,7 +4,6 @@ import asyncio
 from time import perf_counter
 
 import aiohttp
-import msgspec
 
 import fichub_api
 
@@ -27,7 +26,7 @@ urls = [
 
 async def do_work(client: fichub_api.Client, url: str) -> list[str]:
     story_metadata = await client.get_story_metadata(url)
-    return [f"{name:>15}  |  {value}" for name, value in msgspec.structs.asdict(story_metadata).items()]
+    return [f"{name:>15}  |  {getattr(story_metadata, name)}" for name in story_metadata.__struct_fields__]
 
 
 async def test() -> None:
@@ -38,12 +37,12 @@ async def test() -> None:
     async with aiohttp.ClientSession() as session:
         client = fichub_api.Client(session=session)
 
-        # Get the metadata for multiple works multiple times.
+        # Get the metadata for multiple works multiple times, printing each one as soon as it arrives.
         start_time = perf_counter()
-        coros = [do_work(client, url) for url in urls]
-        results = await asyncio.gather(*coros)
+        for coro in asyncio.as_completed([do_work(client, url) for url in urls]):
+            print("\n".join(await coro))
+            print("\n\n-------------------------------\n")
         end_time = perf_counter()
-        print("\n\n-------------------------------\n".join("\n".join(data) for data in results))
         print(f"Time taken: {end_time - start_time:.5f}")
 
     print("Exiting now...")
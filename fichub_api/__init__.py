@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import time
+from collections import OrderedDict
+from functools import partial
 from importlib.metadata import version as im_version
-from typing import TYPE_CHECKING, Any, Union
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Iterable, TypeVar, Union
 from urllib.parse import urljoin
 
 import aiohttp
@@ -25,15 +28,20 @@ else:
 
 __all__ = ("FICHUB_BASE_URL", "FicHubException", "Story", "StoryDownload", "Client")
 
-_DECODER = msgspec.json.Decoder()
+_T = TypeVar("_T")
+
+_EMPTY_RAW_META = (msgspec.Raw(), msgspec.Raw(b"null"), msgspec.Raw(b"{}"))
 FICHUB_BASE_URL = "https://fichub.net/api/v0"
+_META_URL = FICHUB_BASE_URL + "/meta"
+_EPUB_URL = FICHUB_BASE_URL + "/epub"
+_USER_AGENT = f"FicHub API wrapper/v{im_version('fichub_api')}+@Thanos"
 
 
 class FicHubException(Exception):
     """The base exception for the FicHub API."""
 
 
-class AO3Stats(msgspec.Struct, frozen=True):
+class AO3Stats(msgspec.Struct, frozen=True, gc=False):
     """The basic statistics for a story from AO3.
 
     Attributes
@@ -54,7 +62,7 @@ class AO3Stats(msgspec.Struct, frozen=True):
     kudos: int = 0
 
 
-class FFNStats(msgspec.Struct, frozen=True):
+class FFNStats(msgspec.Struct, frozen=True, gc=False):
     """The basic statistics for a story from FFN.
 
     Attributes
@@ -72,11 +80,11 @@ class FFNStats(msgspec.Struct, frozen=True):
     reviews: int = 0
 
 
-class NoStats(msgspec.Struct, frozen=True):
+class NoStats(msgspec.Struct, frozen=True, gc=False):
     """The statistics for a story where those fields are inaccessible through Fichub."""
 
 
-class Author(msgspec.Struct, frozen=True):
+class Author(msgspec.Struct, frozen=True, gc=False):
     """The basic metadata of an author.
 
     Attributes
@@ -97,7 +105,7 @@ class Author(msgspec.Struct, frozen=True):
     url: str
 
 
-class Tags(msgspec.Struct, frozen=True):
+class Tags(msgspec.Struct, frozen=True, gc=False):
     """The AO3-specific tags attached to a story.
 
     Attributes
@@ -112,10 +120,10 @@ class Tags(msgspec.Struct, frozen=True):
         The warning-type tags for this story. Defaults to an empty tuple.
     """
 
-    category: tuple[str, ...] = msgspec.field(default_factory=tuple)
-    freeform: tuple[str, ...] = msgspec.field(default_factory=tuple)
-    relationship: tuple[str, ...] = msgspec.field(default_factory=tuple)
-    warning: tuple[str, ...] = msgspec.field(default_factory=tuple)
+    category: tuple[str, ...] = ()
+    freeform: tuple[str, ...] = ()
+    relationship: tuple[str, ...] = ()
+    warning: tuple[str, ...] = ()
 
 
 class BaseStory(msgspec.Struct, frozen=True):
@@ -162,8 +170,8 @@ class BaseStory(msgspec.Struct, frozen=True):
     words: int
     language: str = "English"
     rating: str = "No Rating"
-    fandoms: tuple[str, ...] = msgspec.field(default_factory=tuple)
-    characters: tuple[str, ...] = msgspec.field(default_factory=tuple)
+    fandoms: tuple[str, ...] = ()
+    characters: tuple[str, ...] = ()
 
 
 class AO3Story(BaseStory, frozen=True, tag="ao3"):
@@ -180,8 +188,8 @@ class AO3Story(BaseStory, frozen=True, tag="ao3"):
     """
 
     is_crossover: bool = False
-    tags: Tags = msgspec.field(default_factory=Tags)
-    stats: AO3Stats = msgspec.field(default_factory=AO3Stats)
+    tags: Tags = Tags()
+    stats: AO3Stats = AO3Stats()
 
 
 class FFNStory(BaseStory, frozen=True, tag="ffn"):
@@ -199,7 +207,7 @@ class FFNStory(BaseStory, frozen=True, tag="ffn"):
 
     is_crossover: bool = False
     genres: str = ""
-    stats: FFNStats = msgspec.field(default_factory=FFNStats)
+    stats: FFNStats = FFNStats()
 
 
 class OtherStory(BaseStory, frozen=True, tag="other"):
@@ -211,13 +219,13 @@ class OtherStory(BaseStory, frozen=True, tag="other"):
         An empty story metrics class.
     """
 
-    stats: NoStats = msgspec.field(default_factory=NoStats)
+    stats: NoStats = NoStats()
 
 
 Story = Union[AO3Story, FFNStory, OtherStory]
 
 
-class DownloadUrls(msgspec.Struct, frozen=True):
+class DownloadUrls(msgspec.Struct, frozen=True, gc=False):
     """A collection of download links for a story retrieved from FicHub.
 
     Attributes
@@ -249,97 +257,177 @@ class StoryDownload(msgspec.Struct, frozen=True):
     meta: Story | None = None
 
 
-def _camel_to_snake_case(string: str) -> str:
-    """Converts a string from camel case to snake case.
+class _RawStoryMetadata(msgspec.Struct, gc=False, rename="camel"):
+    """The story metadata as FicHub sends it, before any site-specific adjustment."""
 
-    Source: https://stackoverflow.com/questions/1175208/elegant-python-function-to-convert-camelcase-to-snake-case#comment133686723_44969381
-    """
+    author: str
+    author_id: int
+    author_local_id: str
+    author_url: str
+    title: str
+    description: str
+    source: str
+    chapters: int
+    created: datetime.datetime
+    updated: datetime.datetime
+    status: str
+    words: int
+    raw_extended_meta: msgspec.Raw = msgspec.Raw()
+
+
+class _FFNExtendedMetadata(msgspec.Struct, gc=False):
+    """The FFN-specific parts of FicHub's extended metadata."""
+
+    rated: str
+    raw_fandom: str
+    characters: str
+    genres: str = ""
+    language: str = "English"
+    crossover: bool = False
+    favorites: str = "0"
+    follows: str = "0"
+    reviews: str = "0"
+
+
+class _AO3ExtendedStats(msgspec.Struct, gc=False):
+    """The AO3-specific statistics within FicHub's extended metadata."""
+
+    bookmarks: str = "0"
+    comments: str = "0"
+    hits: str = "0"
+    kudos: str = "0"
+
+
+class _AO3ExtendedMetadata(msgspec.Struct, gc=False):
+    """The AO3-specific parts of FicHub's extended metadata."""
+
+    stats: _AO3ExtendedStats
+    rating: tuple[str, ...]
+    fandom: tuple[str, ...]
+    character: tuple[str, ...]
+    category: tuple[str, ...] = ()
+    freeform: tuple[str, ...] = ()
+    relationship: tuple[str, ...] = ()
+    warning: tuple[str, ...] = ()
+    language: str = "English"
+
+
+class _OtherExtendedMetadata(msgspec.Struct, gc=False):
+    """The parts of FicHub's extended metadata that are used for any other site."""
+
+    language: str = "English"
+
+
+class _RawStoryDownload(msgspec.Struct, gc=False):
+    """The download links and story metadata as FicHub sends them."""
+
+    urls: DownloadUrls
+    meta: _RawStoryMetadata | None = None
+
+
+class _RawDownloadUrls(msgspec.Struct, gc=False):
+    """Only the download links FicHub sends, for when the accompanying story metadata is malformed."""
+
+    urls: DownloadUrls
+
+
+_STORY_DECODER = msgspec.json.Decoder(_RawStoryMetadata)
+_DOWNLOAD_DECODER = msgspec.json.Decoder(_RawStoryDownload)
+_DOWNLOAD_URLS_DECODER = msgspec.json.Decoder(_RawDownloadUrls)
+_FFN_META_DECODER = msgspec.json.Decoder(_FFNExtendedMetadata)
+_AO3_META_DECODER = msgspec.json.Decoder(_AO3ExtendedMetadata)
+_OTHER_META_DECODER = msgspec.json.Decoder(_OtherExtendedMetadata)
+
+
+def _absolute_fichub_url(link: str) -> str:
+    """Resolves a link relative to FicHub's site, usually a root-relative path."""
 
-    return "".join(
-        char
-        if not char.isupper()
-        else ("" if i and (substr := string[i - 1] + (next_char or "")) == substr.upper() else "_") + char.lower()
-        for i, (char, next_char) in enumerate(zip(string, [*string[1:], None]))
-    ).lstrip("_")
+    if link.startswith("/"):
+        return "https://fichub.net" + link
+    return urljoin("https://fichub.net/", link)
 
 
-def shape_data(data: dict[str, Any]) -> dict[str, Any]:
-    # TODO: Find a way to optimize this.
-    shaped: dict[str, Any] = {}
+def _build_story(raw: _RawStoryMetadata) -> Story:
+    """Turns FicHub's story metadata into the story type for its site of origin."""
 
-    # Identify site origin.
-    if "fanfiction.net" in data["source"]:
-        type_ = "ffn"
-    elif "archiveofourown.org" in data["source"]:
-        type_ = "ao3"
+    source = raw.source
+    author_url = raw.author_url
+    if "fanfiction.net" in source:
+        site = "ffn"
+    elif "archiveofourown.org" in source:
+        site = "ao3"
+        if author_url.startswith("/"):
+            author_url = "https://www.archiveofourown.org" + author_url
     else:
-        type_ = "other"
-
-    # Collect author info.
-    for key in data:
-        if "author" in key:
-            suffix = (key.split("author"))[1]
-            shaped.setdefault("author", {})[_camel_to_snake_case(suffix) if suffix else "name"] = data[key]
-
-    # Fix Ao3 links for authors.
-    if type_ == "ao3":
-        shaped["author"]["url"] = urljoin("https://www.archiveofourown.org", shaped["author"]["url"])
-
-    # Adjust other metadata.
-    if more_meta := data["rawExtendedMeta"]:
-        if type_ == "ffn":
-            story_stats: dict[str, Any] = {
-                key: int(more_meta.get(key, "0").replace(",", "")) for key in ("favorites", "follows", "reviews")
-            }
-            rating = more_meta["rated"]
-            if len(fandoms := more_meta["raw_fandom"].split(" + ", 1)) > 1:
-                fandoms[-1] = fandoms[-1].removesuffix(" Crossover")
-            characters = [
-                char
-                for char in more_meta["characters"].replace("[", ", ").replace("]", ", ").split(", ")
-                if char.strip()
-            ]
-            crossover = more_meta.get("crossover")
-            shaped.update({"genres": more_meta.get("genres", "")})
-        elif type_ == "ao3":
-            story_stats = {
-                key: int(more_meta["stats"].get(key, "0").replace(",", ""))
-                for key in ("bookmarks", "comments", "hits", "kudos")
-            }
-            rating = more_meta.get("rating")[0]
-            fandoms = more_meta.pop("fandom")
-            characters = more_meta.pop("character")
-            crossover = len(fandoms) > 1
-            shaped.update({"tags": more_meta})
-        else:
-            story_stats = {}
-            rating, fandoms, characters = "No Rating", (), ()
-            crossover = False
+        site = "other"
+
+    common: dict[str, Any] = {
+        "author": Author(raw.author_id, raw.author_local_id, raw.author, author_url),
+        "title": raw.title,
+        "description": raw.description,
+        "url": source,
+        "chapters": raw.chapters,
+        "created": raw.created,
+        "updated": raw.updated,
+        "status": raw.status,
+        "words": raw.words,
+    }
+
+    # Missing or empty extended metadata means there's nothing site-specific to add.
+    raw_meta = raw.raw_extended_meta
+    has_meta = raw_meta not in _EMPTY_RAW_META
+
+    if site == "ffn":
+        if not has_meta:
+            return FFNStory(**common)
+        ffn_meta = _FFN_META_DECODER.decode(raw_meta)
+        if len(fandoms := ffn_meta.raw_fandom.split(" + ", 1)) > 1:
+            fandoms[-1] = fandoms[-1].removesuffix(" Crossover")
+        characters = ffn_meta.characters.replace("[", ",").replace("]", ",").split(",")
+        return FFNStory(
+            **common,
+            language=ffn_meta.language,
+            rating=ffn_meta.rated,
+            fandoms=tuple(fandoms),
+            characters=tuple(name for char in characters if (name := char.strip())),
+            is_crossover=ffn_meta.crossover,
+            genres=ffn_meta.genres,
+            stats=FFNStats(
+                int(ffn_meta.favorites.replace(",", "")),
+                int(ffn_meta.follows.replace(",", "")),
+                int(ffn_meta.reviews.replace(",", "")),
+            ),
+        )
 
-        try:
-            more_meta.pop("stats")
-        except KeyError:
-            pass
-
-        shaped.update(
-            {
-                "language": more_meta.pop("language", "English"),
-                "rating": rating,
-                "fandoms": fandoms,
-                "characters": characters,
-                "stats": story_stats,
-                "is_crossover": crossover,
-            },
+    if site == "ao3":
+        if not has_meta:
+            return AO3Story(**common)
+        ao3_meta = _AO3_META_DECODER.decode(raw_meta)
+        stats = ao3_meta.stats
+        return AO3Story(
+            **common,
+            language=ao3_meta.language,
+            rating=ao3_meta.rating[0] if ao3_meta.rating else "No Rating",
+            fandoms=ao3_meta.fandom,
+            characters=ao3_meta.character,
+            is_crossover=len(ao3_meta.fandom) > 1,
+            tags=Tags(ao3_meta.category, ao3_meta.freeform, ao3_meta.relationship, ao3_meta.warning),
+            stats=AO3Stats(
+                int(stats.bookmarks.replace(",", "")),
+                int(stats.comments.replace(",", "")),
+                int(stats.hits.replace(",", "")),
+                int(stats.kudos.replace(",", "")),
+            ),
         )
-    shaped.update({"url": data.pop("source"), "type": type_})
-    data.update(shaped)
-    return data
+
+    if not has_meta:
+        return OtherStory(**common)
+    other_meta = _OTHER_META_DECODER.decode(raw_meta)
+    return OtherStory(**common, language=other_meta.language)
 
 
 def parse_story(data: bytes | str) -> Story:
-    obj = _DECODER.decode(data)
-    obj = shape_data(obj)
-    return msgspec.convert(obj, type=Story)
+    return _build_story(_STORY_DECODER.decode(data))
 
 
 class Client:
@@ -349,12 +437,20 @@ class Client:
     ----------
     session: :class:`aiohttp.ClientSession`, optional
         The asynchronous HTTP session to make requests with. If not passed in, automatically generated. Closing it is
-        not handled automatically by the class if done outside an async context manager.
+        not handled automatically by the class if done outside an async context manager. Passing the same session to
+        several clients lets them share its pooled connections and DNS cache.
     headers: dict[:class:`str`, Any], optional
-        The HTTP headers to send with any requests.
+        The HTTP headers to send with any requests. A session created by the client is given these as its defaults
+        when it's created, so later changes to them only apply to it once it's closed and reopened.
     sema_limit: :class:`int`
         The limit on the number of requests that can be made at once asynchronously. If not between 1 and 3, defaults
         to 2.
+    cache_ttl: :class:`float`, default=300.0
+        How long, in seconds, fetched story metadata and download urls are reused before being requested again. 0
+        disables caching.
+    cache_size: :class:`int`, default=1024
+        The maximum number of results to keep cached. The least recently used ones are dropped first. Can't be
+        negative.
     """
 
     def __init__(
@@ -363,11 +459,22 @@ class Client:
         headers: dict[str, Any] | None = None,
         session: aiohttp.ClientSession | None = None,
         sema_limit: int | None = None,
+        cache_ttl: float = 300.0,
+        cache_size: int = 1024,
     ) -> None:
-        self.headers = headers or {"User-Agent": f"FicHub API wrapper/v{im_version('fichub_api')}+@Thanos"}
+        self.headers = headers or {"User-Agent": _USER_AGENT}
         self.session = session
+        if cache_size < 0:
+            msg = "The cache size can't be negative."
+            raise ValueError(msg)
+
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
         self._sema_limit = sema_limit if (sema_limit and 1 <= sema_limit <= 3) else 2
         self._semaphore = asyncio.Semaphore(value=self._sema_limit)
+        self._own_session: aiohttp.ClientSession | None = None
+        self._cache: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+        self._pending: dict[tuple[str, str], asyncio.Task[Any]] = {}
 
     async def __aenter__(self) -> Self:
         return self
@@ -384,7 +491,8 @@ class Client:
     def sema_limit(self) -> int:
         """:class:`int`: The counter limit for the number of simultaneous requests.
 
-        Limited to between 1 and 3 inclusive.
+        Limited to between 1 and 3 inclusive. A session created by the client caps its connections at the limit it was
+        created with, so raising the limit only takes effect once that session is closed and reopened.
         """
 
         return self._sema_limit
@@ -402,7 +510,18 @@ class Client:
         """Start an HTTP session attached to this instance if necessary."""
 
         if (not self.session) or self.session.closed:
-            self.session = aiohttp.ClientSession()
+            self._create_session()
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        # Every request goes to the same host, so keep connections and DNS lookups around for reuse.
+        connector = aiohttp.TCPConnector(
+            limit=self._sema_limit,
+            limit_per_host=self._sema_limit,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+        )
+        self.session = self._own_session = session = aiohttp.ClientSession(connector=connector, headers=self.headers)
+        return session
 
     async def close(self) -> None:
         """Close the HTTP session attached to this instance if necessary."""
@@ -410,15 +529,15 @@ class Client:
         if self.session and (not self.session.closed):
             await self.session.close()
 
-    async def _get(self, endpoint: str, params: dict[str, Any] | None = None) -> bytes:
+    async def _get(self, url: str, params: dict[str, Any] | None = None) -> bytes:
         """Gets fanfiction data from the FicHub API.
 
-        This restricts the number of simultaneous requests.
+        This restricts the number of simultaneous requests through a semaphore.
 
         Parameters
         ----------
-        endpoint: :class:`str`
-            The path parameters for the endpoint.
+        url: :class:`str`
+            The full url of the endpoint.
         params: dict[:class:`str`, Any] | None, optional
             The query parameters to request from the endpoint.
 
@@ -433,22 +552,59 @@ class Client:
             If there's a client response error.
         """
 
-        await self.start_session()
-        assert self.session
+        session = self.session
+        if (not session) or session.closed:
+            session = self._create_session()
 
+        # Queue here rather than in the connection pool, so the session timeout starts once a request is let through.
         async with self._semaphore:
-            try:
-                url = FICHUB_BASE_URL + endpoint
-                async with self.session.get(url, params=params, headers=self.headers) as response:
-                    response.raise_for_status()
-                    return await response.read()
-            except aiohttp.ClientResponseError as exc:
-                msg = f"HTTP {exc.status}: {exc.message}"
-                raise FicHubException(msg) from None
+            return await self._request(session, url, params)
+
+    async def _request(self, session: aiohttp.ClientSession, url: str, params: dict[str, Any] | None) -> bytes:
+        """Makes a GET request and reads the response body, converting HTTP errors to :exc:`FicHubException`."""
+
+        # A session this client created already sends the headers by default.
+        headers = None if (session is self._own_session) else self.headers
+        try:
+            async with session.get(url, params=params, headers=headers) as response:
+                response.raise_for_status()
+                return await response.read()
+        except aiohttp.ClientResponseError as exc:
+            msg = f"HTTP {exc.status}: {exc.message}"
+            raise FicHubException(msg) from None
+
+    async def _get_cached(self, endpoint: str, url: str, fetch: Callable[[str], Coroutine[Any, Any, _T]]) -> _T:
+        """Gets a result for a story url from the cache, or fetches and caches it.
+
+        Concurrent lookups of the same url and endpoint share a single request.
+        """
+
+        key = (endpoint, url)
+        cached = self._cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            self._cache.move_to_end(key)
+            return cached[1]
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch(url))
+            task.add_done_callback(partial(self._store_result, key))
+            self._pending[key] = task
+        return await asyncio.shield(task)
+
+    def _store_result(self, key: tuple[str, str], task: asyncio.Task[Any]) -> None:
+        del self._pending[key]
+        if (not task.cancelled()) and (task.exception() is None) and self.cache_ttl > 0:
+            self._cache[key] = (time.monotonic() + self.cache_ttl, task.result())
+            self._cache.move_to_end(key)
+            while self._cache and len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
 
     async def get_story_metadata(self, url: str) -> Story:
         """Gets a specific story's metadata.
 
+        Results are reused for up to ``cache_ttl`` seconds, and concurrent lookups of the same url share one request.
+
         Parameters
         ----------
         url: :class:`str`
@@ -460,17 +616,41 @@ class Client:
             The queried story's metadata.
         """
 
+        return await self._get_cached(_META_URL, url, self._fetch_story_metadata)
+
+    async def get_stories_metadata(self, urls: Iterable[str]) -> list[Story | BaseException]:
+        """Gets the metadata of several stories at once.
+
+        The lookups run concurrently, within the client's limit on simultaneous requests. Lookups waiting on that limit
+        aren't subject to the session's timeout until their requests start, so the batch can be of any size.
+
+        Parameters
+        ----------
+        urls: Iterable[:class:`str`]
+            The story URLs to look up.
+
+        Returns
+        -------
+        list[:class:`Story` | :class:`BaseException`]
+            The queried stories' metadata, in the same order as the given urls. A lookup that failed is represented by
+            the exception it raised, usually a :exc:`FicHubException`, instead of stopping the others.
+        """
+
+        return await asyncio.gather(*(self.get_story_metadata(url) for url in urls), return_exceptions=True)
+
+    async def _fetch_story_metadata(self, url: str) -> Story:
         query = {"q": url}
         try:
-            return parse_story(await self._get("/meta", params=query))
-        except (msgspec.MsgspecError, KeyError) as err:
+            return parse_story(await self._get(_META_URL, params=query))
+        except msgspec.MsgspecError as err:
             msg = f"Unable to load story metadata from url: {url}"
             raise FicHubException(msg) from err
 
     async def get_story_downloads(self, url: str) -> StoryDownload:
         """Gets all the download urls for a fanfic in various formats, including epub, html, mobi, and pdf.
 
-        This may also include the story metadata.
+        This may also include the story metadata. Results are reused for up to ``cache_ttl`` seconds, and concurrent
+        lookups of the same url share one request.
 
         Parameters
         ----------
@@ -483,22 +663,34 @@ class Client:
             An object containing all the available metadata and download urls returned by the API.
         """
 
+        return await self._get_cached(_EPUB_URL, url, self._fetch_story_downloads)
+
+    async def _fetch_story_downloads(self, url: str) -> StoryDownload:
         query = {"q": url}
-        data = _DECODER.decode(await self._get("/epub", params=query))
+        data = await self._get(_EPUB_URL, params=query)
 
         try:
-            meta = msgspec.convert(shape_data(data["meta"]), type=Story)
-        except (msgspec.MsgspecError, KeyError):
-            meta = None
+            payload = _DOWNLOAD_DECODER.decode(data)
+        except msgspec.MsgspecError:
+            # Malformed story metadata shouldn't cost the download links too, so try to decode those alone.
+            raw_meta = None
+            try:
+                raw_urls = _DOWNLOAD_URLS_DECODER.decode(data).urls
+            except msgspec.MsgspecError as err:
+                msg = f"Unable to load story download urls from url: {url}"
+                raise FicHubException(msg) from err
+        else:
+            raw_urls, raw_meta = payload.urls, payload.meta
 
         try:
-            urls = msgspec.convert(
-                data["urls"],
-                type=DownloadUrls,
-                dec_hook=lambda _, v: urljoin("https://fichub.net/", v),
-            )
-        except (msgspec.MsgspecError, KeyError) as err:
-            msg = f"Unable to load story download urls from url: {url}"
-            raise FicHubException(msg) from err
-        else:
-            return StoryDownload(urls, meta)
+            meta = _build_story(raw_meta) if raw_meta else None
+        except msgspec.MsgspecError:
+            meta = None
+
+        urls = DownloadUrls(
+            _absolute_fichub_url(raw_urls.epub),
+            _absolute_fichub_url(raw_urls.html),
+            _absolute_fichub_url(raw_urls.mobi),
+            _absolute_fichub_url(raw_urls.pdf),
+        )
+        return StoryDownload(urls, meta)
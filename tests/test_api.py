@@ -29,6 +29,22 @@ async def test_get_story_metadata(test_url):
     assert hash(story)
 
 
+@pytest.mark.asyncio
+async def test_get_stories_metadata():
+    test_urls = [
+        "https://archiveofourown.org/works/45753478/",
+        "https://www.fanfiction.net/s/13274956/1/Harry-Potter-Squatter/",
+        "https://forums.spacebattles.com/threads/nemesis-worm-au.747148",
+        "https://archiveofourown.org/works/45753478/",
+    ]
+    async with fichub_api.Client() as client:
+        stories = await client.get_stories_metadata(test_urls)
+
+    assert len(stories) == len(test_urls)
+    assert all(isinstance(story, (fichub_api.AO3Story, fichub_api.FFNStory, fichub_api.OtherStory)) for story in stories)
+    assert stories[0] is stories[-1]
+
+
 @pytest.mark.parametrize(
     "test_url",
     [